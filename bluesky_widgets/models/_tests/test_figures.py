@@ -136,8 +136,11 @@ def test_artist_set_axes_at_init(artist_factory):
     assert artist.axes is axes
 
     # Once line belong to a axes, it cannot belong to another axes.
-    with pytest.raises(CallbackException) as exc_info:
+    with pytest.raises(AxesAlreadySet):
         Axes(artists=[artist])
+    other_axes = Axes()
+    with pytest.raises(CallbackException) as exc_info:
+        other_axes.artists.append(artist)
     exc = exc_info.value
     assert hasattr(exc, "__cause__") and isinstance(exc.__cause__, AxesAlreadySet)
 
@@ -153,7 +156,154 @@ def test_artist_set_axes_after_init(artist_factory):
     assert artist.axes is axes
 
     # Once line belong to a axes, it cannot belong to another axes.
-    with pytest.raises(CallbackException) as exc_info:
+    with pytest.raises(AxesAlreadySet):
         Axes(artists=[artist])
+    other_axes = Axes()
+    with pytest.raises(CallbackException) as exc_info:
+        other_axes.artists.append(artist)
     exc = exc_info.value
     assert hasattr(exc, "__cause__") and isinstance(exc.__cause__, AxesAlreadySet)
+
+
+def test_repr_tracks_changes():
+    "The cached repr summarizes children; debug_repr shows the whole spec tree."
+    figure = func(run)
+    (axes,) = figure.axes
+    (line,) = axes.artists
+    assert "<1 axes>" in repr(figure)
+    assert "<1 artists>" in repr(axes)
+    assert "axes title" in figure.debug_repr()
+    axes.title = "new axes title"
+    assert "new axes title" in repr(axes)
+    assert "new axes title" in figure.debug_repr()
+    line.update_style(color="red")
+    assert "'red'" in repr(line)
+    assert "'red'" in figure.debug_repr()
+    line.label = "new label"
+    assert "new label" in axes.debug_repr()
+    axes.artists.clear()
+    assert "<0 artists>" in repr(axes)
+    assert "new label" not in figure.debug_repr()
+
+
+def test_debug_repr_follows_artist_order():
+    "debug_repr lists artists in the order of Axes.artists."
+    first, second, third = (Line.from_run(transform, run, label) for label in ("first", "second", "third"))
+    axes = Axes(artists=[second])
+    axes.artists.insert(0, first)
+    axes.artists.append(third)
+    debug_repr = axes.debug_repr()
+    assert debug_repr.index("'first'") < debug_repr.index("'second'") < debug_repr.index("'third'")
+
+
+def test_by_label_tracks_changes():
+    "by_label reflects artists added, removed, and relabeled."
+    line = Line.from_run(transform, run, "a")
+    axes = Axes(artists=[line])
+    assert axes.by_label["a"] == (line,)
+    other_line = Line.from_run(transform, run, "a")
+    axes.artists.append(other_line)
+    assert axes.by_label["a"] == (line, other_line)
+    line.label = "b"
+    assert axes.by_label["a"] == (other_line,)
+    assert axes.by_label["b"] == (line,)
+    axes.artists.remove(line)
+    assert "b" not in axes.by_label
+    line.label = "c"  # no longer on these Axes
+    assert set(axes.by_label) == {"a"}
+
+
+def test_by_label_follows_artist_order():
+    "Groups in by_label and the keys of by_uuid follow the order of Axes.artists."
+    first, second, third, fourth = (Line.from_run(transform, run, "a") for _ in range(4))
+    axes = Axes(artists=[second])
+    axes.by_label  # Build the index before the changes.
+    axes.artists.insert(0, first)
+    axes.artists.append(third)
+    assert axes.by_label["a"] == (first, second, third)
+    axes.artists[1] = fourth
+    assert axes.by_label["a"] == (first, fourth, third)
+    assert list(axes.by_uuid.values()) == [first, fourth, third]
+
+
+def test_by_label_first_queried_after_changes():
+    "by_label is built on first access and reflects changes made before then."
+    line = Line.from_run(transform, run, "a")
+    other_line = Line.from_run(transform, run, "a")
+    axes = Axes(artists=[line])
+    axes.artists.append(other_line)
+    line.label = "b"
+    assert axes.by_label == {"a": (other_line,), "b": (line,)}
+
+
+def test_remove_artists_while_iterating_by_label():
+    "by_label is a snapshot, so artists can be removed while iterating over it."
+    axes = Axes(artists=[Line.from_run(transform, run, label) for label in "abc"])
+    for label, artists in axes.by_label.items():
+        for artist in artists:
+            axes.artists.remove(artist)
+    assert not axes.artists
+    assert not axes.by_label
+
+
+def test_str_subclass_label():
+    "Labels of str subclasses (e.g. numpy.str_) are accepted and looked up by value."
+
+    class Label(str):
+        pass
+
+    line = Line.from_run(transform, run, Label("a"))
+    axes = Axes(artists=[line])
+    assert line.label == "a"
+    assert axes.by_label["a"] == (line,)
+
+
+def test_figure_by_uuid():
+    "Figure indexes its Axes and all their artists by uuid."
+    figure = func(run)
+    (axes,) = figure.axes
+    (line,) = axes.artists
+    assert figure.axes_by_uuid[axes.uuid] is axes
+    assert figure.artists_by_uuid[line.uuid] is line
+    other_line = Line.from_run(transform, run, "other label")
+    axes.artists.append(other_line)
+    assert figure.artists_by_uuid[other_line.uuid] is other_line
+    axes.artists.remove(line)
+    assert line.uuid not in figure.artists_by_uuid
+    # The mappings are snapshots, so artists can be removed while iterating.
+    for artist in figure.artists_by_uuid.values():
+        axes.artists.remove(artist)
+    assert not figure.artists_by_uuid
+
+
+@pytest.mark.parametrize("cls", [Line, Image])
+def test_specs_are_slotted(cls):
+    "Specs declare all of their attributes in __slots__ and carry no __dict__."
+    figure = func(run)
+    (axes,) = figure.axes
+    artist = cls(transform, label="label")
+    for spec in (figure, axes, artist):
+        assert not hasattr(spec, "__dict__")
+
+
+def test_style():
+    "style is a read-only view that reflects update_style."
+    line = Line.from_run(transform, run, "label", style={"color": "blue"})
+    style = line.style
+    with pytest.raises(TypeError):
+        style["color"] = "red"
+    line.update_style(color="red")
+    assert style["color"] == "red"
+    assert line.style is style
+
+
+def test_empty_style_is_not_shared():
+    "Artists created without style have their own live style mapping."
+    line = Line.from_run(transform, run, "label")
+    other_line = Line.from_run(transform, run, "label")
+    style = line.style
+    assert style == other_line.style == {}
+    line.update_style(color="red")
+    assert style == {"color": "red"}
+    assert line.style is style
+    assert other_line.style == {}
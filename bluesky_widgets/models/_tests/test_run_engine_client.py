@@ -0,0 +1,189 @@
+import pytest
+
+from ..run_engine_client import RunEngineClient, _copy_item, _intern_item_values
+
+# Description of the 'count' plan in the format returned by RE Manager ('plans_allowed')
+_plan_count = {
+    "name": "count",
+    "parameters": [
+        {"name": "detectors", "kind": {"name": "POSITIONAL_OR_KEYWORD", "value": 1}},
+        {"name": "num", "kind": {"name": "POSITIONAL_OR_KEYWORD", "value": 1}, "default": "1"},
+    ],
+}
+
+
+@pytest.fixture
+def client():
+    "RunEngineClient that is not connected to RE Manager. Requests to the server are not sent."
+    client = RunEngineClient()
+    client._allowed_plans["count"] = _plan_count
+    yield client
+    client._client.close()
+
+
+def _plan(item_uid="some-uid", **kwargs):
+    return {
+        "item_uid": item_uid,
+        "item_type": "plan",
+        "name": "count",
+        "args": [["det1"]],
+        "kwargs": kwargs,
+        "user": "Test User",
+        "user_group": "primary",
+    }
+
+
+def test_parameters_track_item_updates(client):
+    "Parameters are refreshed if the item is updated on the server without changing its UID."
+    item = _plan(num=1)
+    assert client.get_item_value_for_label(item=item, label="Parameters") == "detectors: ['det1'], num: 1"
+    updated_item = _plan(num=10)
+    assert client.get_item_value_for_label(item=updated_item, label="Parameters") == (
+        "detectors: ['det1'], num: 10"
+    )
+
+
+def test_parameters_track_item_changes_in_place(client):
+    "Parameters are refreshed if the item is modified in place."
+    item = _plan(num=1)
+    assert client.get_item_value_for_label(item=item, label="Parameters") == "detectors: ['det1'], num: 1"
+    item["kwargs"]["num"] = 10
+    item["args"][0].append("det2")
+    assert client.get_item_value_for_label(item=item, label="Parameters") == (
+        "detectors: ['det1', 'det2'], num: 10"
+    )
+
+
+def test_default_column_values(client):
+    "Values and string representations of the columns in the default map."
+    item = _plan(num=3)
+    item["result"] = {"exit_status": "completed"}
+    expected = {
+        "": ("plan", "P"),
+        "Name": ("count", "count"),
+        "Parameters": ({"args": [["det1"]], "kwargs": {"num": 3}}, "detectors: ['det1'], num: 3"),
+        "USER": ("Test User", "Test User"),
+        "GROUP": ("primary", "primary"),
+        "STATUS": ("completed", "completed"),
+    }
+    for label, (value, value_str) in expected.items():
+        assert client.get_item_value_for_label(item=item, label=label, as_str=False) == value
+        assert client.get_item_value_for_label(item=item, label=label) == value_str
+
+
+def test_column_parameters_are_not_bound(client):
+    "Parameters of items that can not be bound to plan parameters are shown as passed."
+    instruction = {"item_uid": "instruction-uid", "item_type": "instruction", "name": "queue_stop"}
+    assert client.get_item_value_for_label(item=instruction, label="") == "I"
+    assert client.get_item_value_for_label(item=instruction, label="Parameters") == ""
+    item = _plan(num=3)
+    item["name"] = "unknown_plan"
+    assert client.get_item_value_for_label(item=item, label="Parameters") == "['det1'], num: 3"
+
+
+def test_column_value_missing(client):
+    "Missing labels and missing (including nested) parameters raise KeyError."
+    item = _plan()
+    with pytest.raises(KeyError, match="Label 'unknown' is not found in the map dictionary"):
+        client.get_item_value_for_label(item=item, label="unknown")
+    with pytest.raises(KeyError, match=r"Parameter with keys \('result', 'exit_status'\) is not found"):
+        client.get_item_value_for_label(item=item, label="STATUS")
+    item["result"] = {}
+    with pytest.raises(KeyError, match=r"Parameter with keys \('result', 'exit_status'\) is not found"):
+        client.get_item_value_for_label(item=item, label="STATUS")
+    del item["user"]
+    with pytest.raises(KeyError, match=r"Parameter with keys \('user',\) is not found"):
+        client.get_item_value_for_label(item=item, label="USER")
+
+
+def test_custom_column_map(client):
+    "Columns may be mapped to args, kwargs and nested keys."
+    client.set_map_param_labels_to_keys(map_dict={"Args": ("args",), "Time": ("result", "time", "start")})
+    item = _plan(num=3)
+    item["result"] = {"time": {"start": 10.5}}
+    assert client.get_item_value_for_label(item=item, label="Args") == "detectors: ['det1'], num: 3"
+    assert client.get_item_value_for_label(item=item, label="Time") == "10.5"
+    with pytest.raises(KeyError, match="Label 'Name' is not found"):
+        client.get_item_value_for_label(item=item, label="Name")
+
+
+def test_copy_item():
+    "Items are copied deeply: no dicts or lists are shared between the item and its copy."
+    item = _plan(num=3)
+    item["result"] = {"exit_status": "completed", "run_uids": ["a", "b"], "time": (1, [2])}
+    item_copy = _copy_item(item)
+    assert item_copy == item
+    assert item_copy is not item
+    for key in ("args", "kwargs", "result"):
+        assert item_copy[key] is not item[key]
+    assert item_copy["args"][0] is not item["args"][0]
+    assert item_copy["result"]["run_uids"] is not item["result"]["run_uids"]
+    assert item_copy["result"]["time"][1] is not item["result"]["time"][1]
+    item_copy["kwargs"]["num"] = 5
+    assert item["kwargs"]["num"] == 3
+
+
+def test_intern_item_values():
+    "Repeated string values are shared between items; other values are not changed."
+    # Build the strings at runtime, so that they are not shared as constants
+    items = [_plan(item_uid="".join(["uid", str(n)]), num=n) for n in range(2)]
+    for item in items:
+        item["name"] = "".join(["co", "unt"])
+        item["user"] = None
+    items_copy = _copy_item(items)
+    assert items[0]["name"] is not items[1]["name"]
+    _intern_item_values(items)
+    assert items == items_copy
+    assert items[0]["name"] is items[1]["name"]
+    assert items[0]["item_uid"] != items[1]["item_uid"]
+
+
+@pytest.fixture
+def status_requests(client):
+    "Replace the 'status' request with a stub. Returns the list of statuses returned by the stub."
+    statuses = []
+
+    def status():
+        # The status contains no UIDs, so no other data is reloaded.
+        statuses.append({"manager_state": "idle", "n_request": len(statuses)})
+        return statuses[-1]
+
+    client._client.status = status
+    return statuses
+
+
+def test_load_status_first_call(client, status_requests):
+    "The first status request is sent regardless of the buffering period."
+    events = []
+    client.events.status_changed.connect(events.append)
+    client.load_re_manager_status()
+    assert len(status_requests) == 1
+    assert client.re_manager_status == status_requests[0]
+    assert client.re_manager_connected is True
+    assert len(events) == 1
+
+
+def test_load_status_buffered(client, status_requests):
+    "Requests made within the update period return the status loaded before."
+    client.load_re_manager_status()
+    status = client.re_manager_status
+    client.load_re_manager_status()
+    assert len(status_requests) == 1
+    assert client.re_manager_status is status
+    assert status == status_requests[0]
+
+    # The period expired
+    client._re_manager_status_update_period = 0
+    client.load_re_manager_status()
+    assert len(status_requests) == 2
+    assert client.re_manager_status is status
+    assert status == status_requests[1]
+
+
+def test_load_status_unbuffered(client, status_requests):
+    "Unbuffered requests are always sent to the server."
+    client.load_re_manager_status()
+    client.load_re_manager_status(unbuffered=True)
+    client.load_re_manager_status(unbuffered=True)
+    assert len(status_requests) == 3
+    assert client.re_manager_status == status_requests[2]
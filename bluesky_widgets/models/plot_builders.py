@@ -236,7 +236,7 @@ class Lines:
 
                 def restyle_line_when_complete(event):
                     "When run is complete, update style."
-                    line.style.update({"color": next(self._color_cycle)})
+                    line.update_style(color=next(self._color_cycle))
 
                 run.events.completed.connect(restyle_line_when_complete)
             else:
@@ -271,7 +271,7 @@ class Lines:
 
                 def restyle_line_when_complete(event):
                     "When run is complete, update style."
-                    line.style.update({"color": next(self._color_cycle)})
+                    line.update_style(color=next(self._color_cycle))
 
                 run.events.completed.connect(restyle_line_when_complete)
             else:
@@ -659,7 +659,7 @@ class RasteredImages:
         self._cmap = value
         for artist in self.axes.artists:
             if isinstance(artist, Image):
-                artist.style.update({"cmap": value})
+                artist.update_style(cmap=value)
 
     @property
     def clim(self):
@@ -670,7 +670,7 @@ class RasteredImages:
         self._clim = value
         for artist in self.axes.artists:
             if isinstance(artist, Image):
-                artist.style.update({"clim": value})
+                artist.update_style(clim=value)
 
     @property
     def extent(self):
@@ -681,7 +681,7 @@ class RasteredImages:
         self._extent = value
         for artist in self.axes.artists:
             if isinstance(artist, Image):
-                artist.style.update({"extent": value})
+                artist.update_style(extent=value)
 
     @property
     def x_positive(self):
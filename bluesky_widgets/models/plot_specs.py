@@ -7,27 +7,64 @@ not know about their parents: thus, Figures know about their Axes and Axes know
 about their Artists.
 """
 
-import collections
-import uuid as uuid_module
+import itertools
+import sys
+import types
 
-from ..utils.dict_view import DictView, UpdateOnlyDict
+from ..utils.dict_view import DictView
 from ..utils.event import EmitterGroup, Event
 from ..utils.list import EventedList
 
+# Default identifiers are drawn from a process-wide counter. They only need to
+# be unique within this process, and this is much cheaper than uuid4(), which
+# reads from os.urandom for every spec.
+_next_id = itertools.count(1).__next__
+
 
 class BaseSpec:
     "Just a class with a uuid attribute and some slots."
-    __slots__ = ("_uuid", "events", "__weakref__")
+    __slots__ = ("_uuid", "events", "_repr_cache", "__weakref__")
+
+    # Names of the events each subclass emits, mapped to the emitter
+    # keyword arguments once per class by __init_subclass__.
+    _event_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._emitters = dict.fromkeys(cls._event_names, Event)
+        # Looked up once per class rather than via __class__ in every repr.
+        cls._repr_name = cls.__name__
 
     def __init__(self, uuid):
         if uuid is None:
-            uuid = uuid_module.uuid4()
+            uuid = _next_id()
         self._uuid = uuid
+        self.events = EmitterGroup(source=self, **self._emitters)
+        self._repr_cache = None
 
     @property
     def uuid(self):
         return self._uuid
 
+    def _invalidate_repr(self):
+        # The repr is cached and must be dropped whenever something it shows
+        # changes.
+        self._repr_cache = None
+
+    def __repr__(self):
+        if self._repr_cache is None:
+            self._repr_cache = self._make_repr()
+        return self._repr_cache
+
+    def debug_repr(self):
+        """
+        Like repr, but with the full repr of any children inlined.
+
+        The plain repr only summarizes children, so that it stays cheap for
+        large figures. This walks the whole spec tree every time.
+        """
+        return repr(self)
+
 
 class Figure(BaseSpec):
     """
@@ -38,15 +75,16 @@ class Figure(BaseSpec):
     axes : Tuple[Axes]
     title : String
         Figure title text
-    uuid : UUID, optional
-        Automatically assigned to provide a unique identifier for this Figure,
+    uuid : hashable, optional
+        Automatically assigned to provide an identifier, unique within this process,
         used internally to track it.
     short_title: String, optional
         Shorter figure title text, used in (for example) tab labels. Views
         should fall back on ``title`` if this is None.
     """
 
-    __slots__ = ("_axes", "_title", "_short_title")
+    __slots__ = ("_axes", "_title", "_short_title", "_axes_by_uuid", "_artists_by_uuid")
+    _event_names = ("title", "short_title")
 
     def __init__(self, axes, *, title, uuid=None, short_title=None):
         for ax in axes:
@@ -54,7 +92,14 @@ class Figure(BaseSpec):
         self._axes = tuple(axes)
         self._title = title
         self._short_title = short_title
-        self.events = EmitterGroup(source=self, title=Event, short_title=Event)
+        # Flat indexes so that a uuid can be resolved without walking every
+        # Axes. The Axes are fixed, but their artists may come and go.
+        self._axes_by_uuid = {ax.uuid: ax for ax in self._axes}
+        self._artists_by_uuid = {}
+        for ax in self._axes:
+            self._artists_by_uuid.update(ax.by_uuid)
+            ax.artists.events.added.connect(self._on_artist_added)
+            ax.artists.events.removed.connect(self._on_artist_removed)
         super().__init__(uuid)
 
     @property
@@ -69,6 +114,27 @@ class Figure(BaseSpec):
         """
         return self._axes
 
+    @property
+    def axes_by_uuid(self):
+        """
+        Access Axes as a read-only dict keyed by uuid.
+        """
+        return DictView(dict(self._axes_by_uuid))
+
+    @property
+    def artists_by_uuid(self):
+        """
+        Access the artists on all Axes as a read-only dict keyed by uuid.
+        """
+        return DictView(dict(self._artists_by_uuid))
+
+    def _on_artist_added(self, event):
+        artist = event.item
+        self._artists_by_uuid[artist.uuid] = artist
+
+    def _on_artist_removed(self, event):
+        self._artists_by_uuid.pop(event.item.uuid, None)
+
     @property
     def title(self):
         "String for figure title. Settable."
@@ -77,6 +143,7 @@ class Figure(BaseSpec):
     @title.setter
     def title(self, value):
         self._title = value
+        self._invalidate_repr()
         self.events.title(value=value, figure_spec=self)
 
     @property
@@ -87,11 +154,18 @@ class Figure(BaseSpec):
     @short_title.setter
     def short_title(self, value):
         self._short_title = value
+        self._invalidate_repr()
         self.events.short_title(value=value, figure_spec=self)
 
-    def __repr__(self):
+    def _make_repr(self):
+        return self._format_repr(f"<{len(self._axes)} axes>")
+
+    def debug_repr(self):
+        return self._format_repr("(" + ", ".join(ax.debug_repr() for ax in self._axes) + ")")
+
+    def _format_repr(self, axes):
         return (
-            f"{self.__class__.__name__}(axes={self.axes!r}, "
+            f"{self._repr_name}(axes={axes}, "
             f"title={self.title!r}, short_title={self.short_title!r}, "
             f"uuid={self.uuid!r})"
         )
@@ -116,8 +190,8 @@ class Axes(BaseSpec):
         Limits of x axis
     y_limits : Tuple[Float]
         Limits of y axis
-    uuid : UUID, optional
-        Automatically assigned to provide a unique identifier for this Figure,
+    uuid : hashable, optional
+        Automatically assigned to provide an identifier, unique within this process,
         used internally to track it.
 
     Examples
@@ -150,8 +224,8 @@ class Axes(BaseSpec):
 
     Or by label
 
-    >>> axes.by_label["Scan 8"]  # list of all plot entities with this label
-    [Line(...)]  # typically contains just one element
+    >>> axes.by_label["Scan 8"]  # tuple of all plot entities with this label
+    (Line(...),)  # typically contains just one element
     """
 
     __slots__ = (
@@ -163,7 +237,9 @@ class Axes(BaseSpec):
         "_aspect",
         "_x_limits",
         "_y_limits",
+        "_by_label",
     )
+    _event_names = ("figure", "title", "x_label", "y_label", "aspect", "x_limits", "y_limits")
 
     def __init__(
         self,
@@ -179,25 +255,16 @@ class Axes(BaseSpec):
     ):
         super().__init__(uuid)
         self._figure = None
-        self._artists = ArtistList()
         self._title = title
         self._x_label = x_label
         self._y_label = y_label
         self._aspect = aspect
         self._x_limits = x_limits
         self._y_limits = y_limits
-        self.events = EmitterGroup(
-            source=self,
-            figure=Event,
-            title=Event,
-            x_label=Event,
-            y_label=Event,
-            aspect=Event,
-            x_limits=Event,
-            y_limits=Event,
-        )
+        self._adopt_many(artists or [])
         self.artists.events.adding.connect(self._on_artist_adding)
-        self.artists.extend(artists or [])
+        self.artists.events.added.connect(self._on_artist_added)
+        self.artists.events.removed.connect(self._on_artist_removed)
 
     @property
     def figure(self):
@@ -234,27 +301,32 @@ class Axes(BaseSpec):
         Access artists as a read-only dict keyed by label.
 
         Since two artists are allowed to have the same label, the values are
-        *lists*. In the common case, the list will have just one element.
+        *tuples*. In the common case, the tuple will have just one element.
 
         Examples
         --------
 
         Look up an object (e.g. a line) by its label and change its color.
 
-        >>> spec = axes_spec.by_label["Scan 3"]
-        >>> spec.style.update(color="red")
+        >>> (spec,) = axes_spec.by_label["Scan 3"]
+        >>> spec.update_style(color="red")
         """
-        mapping = collections.defaultdict(list)
-        for artist in self.artists:
-            mapping[artist.label].append(artist)
-        return DictView(dict(mapping))
+        if self._by_label is None:
+            # Group the artists in the order of the list, so that the first
+            # artist in each group is the first one in self.artists.
+            groups = {}
+            for artist in self._artists:
+                groups.setdefault(artist.label, []).append(artist)
+            self._by_label = {label: tuple(group) for label, group in groups.items()}
+        # Return a snapshot, so that callers may add or remove artists while iterating.
+        return DictView(dict(self._by_label))
 
     @property
     def by_uuid(self):
         """
         Access artists as a read-only dict keyed by uuid.
         """
-        return DictView({artist.uuid: artist for artist in self.artists})
+        return DictView({artist.uuid: artist for artist in self._artists})
 
     def discard(self, artist):
         "Discard any Aritst."
@@ -275,6 +347,7 @@ class Axes(BaseSpec):
     @title.setter
     def title(self, value):
         self._title = value
+        self._invalidate_repr()
         self.events.title(value=value)
 
     @property
@@ -285,6 +358,7 @@ class Axes(BaseSpec):
     @x_label.setter
     def x_label(self, value):
         self._x_label = value
+        self._invalidate_repr()
         self.events.x_label(value=value)
 
     @property
@@ -295,6 +369,7 @@ class Axes(BaseSpec):
     @y_label.setter
     def y_label(self, value):
         self._y_label = value
+        self._invalidate_repr()
         self.events.y_label(value=value)
 
     @property
@@ -305,6 +380,7 @@ class Axes(BaseSpec):
     @aspect.setter
     def aspect(self, value):
         self._aspect = value
+        self._invalidate_repr()
         self.events.aspect(value=value)
 
     @property
@@ -315,6 +391,7 @@ class Axes(BaseSpec):
     @x_limits.setter
     def x_limits(self, value):
         self._x_limits = value
+        self._invalidate_repr()
         self.events.x_limits(value=value)
 
     @property
@@ -325,6 +402,7 @@ class Axes(BaseSpec):
     @y_limits.setter
     def y_limits(self, value):
         self._y_limits = value
+        self._invalidate_repr()
         self.events.y_limits(value=value)
 
     def _on_artist_adding(self, event):
@@ -334,10 +412,43 @@ class Axes(BaseSpec):
         artist = event.item
         artist.set_axes(self)
 
-    def __repr__(self):
+    def _adopt_many(self, artists):
+        # Bulk counterpart to _on_artist_adding for the artists given at init
+        # time. Nothing can be subscribed to the list yet, so build it directly
+        # and set their axes in one pass, skipping the per-artist adding/added
+        # events.
+        self._artists = ArtistList(artists)
+        # Built on the first access to by_label after any change to the
+        # artists or their labels, and reused until the next change.
+        self._by_label = None
+        for artist in self._artists:
+            artist.set_axes(self)
+            artist.events.label.connect(self._on_artist_label_changed)
+
+    def _on_artist_added(self, event):
+        event.item.events.label.connect(self._on_artist_label_changed)
+        self._by_label = None
+        self._invalidate_repr()
+
+    def _on_artist_removed(self, event):
+        event.item.events.label.disconnect(self._on_artist_label_changed)
+        self._by_label = None
+        self._invalidate_repr()
+
+    def _on_artist_label_changed(self, event):
+        self._by_label = None
+
+    def _make_repr(self):
+        return self._format_repr(f"<{len(self._artists)} artists>")
+
+    def debug_repr(self):
+        artists = ", ".join(artist.debug_repr() for artist in self._artists)
+        return self._format_repr(f"{self._artists.__class__.__name__}([{artists}])")
+
+    def _format_repr(self, artists):
         return (
-            f"{self.__class__.__name__}(artists={self.artists!r}, "
-            f"title={self.title!r},"
+            f"{self._repr_name}(artists={artists}, "
+            f"title={self.title!r}, "
             f"x_label={self.x_label!r}, y_label={self.y_label!r}, "
             f"aspect={self.aspect!r}, x_limits={self.x_limits!r}, "
             f"y_limits={self.y_limits!r}, uuid={self.uuid!r})"
@@ -358,37 +469,30 @@ class ArtistSpec(BaseSpec):
         Label used in legend and for lookup by label on Axes.
     style : Dict, optional
         Options passed through to plotting framework, such as ``color`` or
-        ``label``.
+        ``label``. Change them later using :meth:`update_style`.
     axes : Axes, optional
         This may be specified here or set later using :meth:`set_axes`. Once
         specified, it cannot be changed.
     live : Boolean, optional
         Listen for future updates.
-    uuid : UUID, optional
-        Automatically assigned to provide a unique identifier for this Figure,
+    uuid : hashable, optional
+        Automatically assigned to provide an identifier, unique within this process,
         used internally to track it.
     """
 
-    __slots__ = ("_live", "_update", "_label", "_style", "_axes")
+    __slots__ = ("_live", "_update", "_label", "_style", "_style_view", "_axes")
+    _event_names = ("label", "new_data", "completed", "style_updated")
 
     def __init__(self, update, *, label, style=None, axes=None, live=True, uuid=None):
         self._update = update
-        self._label = label
-        self._style = UpdateOnlyDict(style or {})
+        # Labels are often shared by many artists (e.g. "Scan 8" on several
+        # Axes) and are used as keys in by_label, so intern them.
+        self._label = sys.intern(label) if type(label) is str else label
+        self._style = dict(style or {})
+        # A live read-only view, made once rather than on every access.
+        self._style_view = types.MappingProxyType(self._style)
         self._axes = axes
         self._live = live
-        self.events = EmitterGroup(
-            source=self,
-            label=Event,
-            new_data=Event,
-            completed=Event,
-            style_updated=Event,
-        )
-        # Re-emit updates. It's important to re-emit (not just pass through)
-        # because the consumer will need access to self.
-        self._style.events.updated.connect(
-            lambda event: self.events.style_updated(update=event.update, artist_spec=self)
-        )
         super().__init__(uuid)
 
     @property
@@ -423,8 +527,8 @@ class ArtistSpec(BaseSpec):
         axes : Axes, optional
             This may be specified here or set later using :meth:`set_axes`. Once
             specified, it cannot be changed.
-        uuid : UUID, optional
-            Automatically assigned to provide a unique identifier for this Figure,
+        uuid : hashable, optional
+            Automatically assigned to provide an identifier, unique within this process,
             used internally to track it.
         """
         # Isolating bluesky-aware stuff here, including this import.
@@ -452,6 +556,7 @@ class ArtistSpec(BaseSpec):
                 f"to {self.axes} and thus cannot be added to {axes}."
             )
         self._axes = axes
+        self._invalidate_repr()
 
     @property
     def axes(self):
@@ -471,35 +576,56 @@ class ArtistSpec(BaseSpec):
 
     @label.setter
     def label(self, value):
-        self._label = str(value)
+        self._label = sys.intern(str(value))
+        self._invalidate_repr()
         self.events.label(value=value, artist_spec=self)
 
     @property
     def style(self):
         """
-        Options passed to the artist.
+        Options passed to the artist, as a read-only mapping.
 
         This *is* settable but it has to be done like:
 
-        >>> spec.style.update({"color": "blue"})
+        >>> spec.update_style(color="blue")
 
         Attempts to modify the contents will be disallowed:
 
         >>> spec.style["color"] = blue  # TypeError!
         >>> del spec.style["color"]  # TypeError!
+
+        The mapping reflects later updates.
         """
-        return self._style
+        return self._style_view
 
     @style.setter
     def style(self, update):
         # Provide a more helpful error than the default,
         # AttributeError: can't set attribute.
-        raise AttributeError(f"can't set attribute. Use style.update({update!r}) instead of style = {update!r}.")
+        raise AttributeError(f"can't set attribute. Use update_style({update!r}) instead of style = {update!r}.")
 
-    def __repr__(self):
+    def update_style(self, *args, **kwargs):
+        """
+        Update options passed to the artist.
+
+        This accepts the same arguments as ``dict.update``.
+
+        >>> spec.update_style(color="blue")
+        >>> spec.update_style({"color": "blue"})
+        """
+        update = dict(*args, **kwargs)
+        self._style.update(update)
+        self._invalidate_repr()
+        self.events.style_updated(update=update, artist_spec=self)
+
+    def _make_repr(self):
+        # Show the Axes by uuid only. Its full repr includes this artist, and
+        # embedding it would make the cached repr depend on which of the two
+        # was repr'd first.
+        axes = None if self.axes is None else f"<{self.axes._repr_name} uuid={self.axes.uuid!r}>"
         return (
-            f"{self.__class__.__name__}(update={self.update!r}"
-            f"label={self.label!r}, style={self.style!r}, axes={self.axes!r}"
+            f"{self._repr_name}(update={self.update!r}, "
+            f"label={self.label!r}, style={self._style!r}, axes={axes}, "
             f"uuid={self.uuid!r})"
         )
 
@@ -523,8 +649,8 @@ class Line(ArtistSpec):
     axes : Axes, optional
         This may be specified here or set later using :meth:`set_axes`. Once
         specified, it cannot be changed.
-    uuid : UUID, optional
-        Automatically assigned to provide a unique identifier for this Figure,
+    uuid : hashable, optional
+        Automatically assigned to provide an identifier, unique within this process,
         used internally to track it.
     """
 
@@ -534,6 +660,8 @@ class Line(ArtistSpec):
 class Image(ArtistSpec):
     "Describes an image (both data and style)"
 
+    __slots__ = ()
+
 
 # EventedLists for each type of spec. We plan to add type-checking to these,
 # hence a specific container for each.
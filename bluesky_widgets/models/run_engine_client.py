@@ -3,8 +3,11 @@ import copy
 import datetime
 import importlib
 import json
+import logging
+import operator
 import os.path
 import pprint
+import sys
 import time
 
 import yaml
@@ -15,6 +18,40 @@ from bluesky_queueserver_api._defaults import default_user_group
 from bluesky_queueserver_api.http import REManagerAPI as REManagerAPI_HTTP
 from bluesky_queueserver_api.zmq import REManagerAPI as REManagerAPI_ZMQ
 
+logger = logging.getLogger(__name__)
+
+
+def _copy_item(value):
+    """
+    Deep copy of an item received from the server. Items are decoded JSON, so they contain
+    only dicts, lists and immutable values, and copying them does not need the generality
+    (and overhead) of ``copy.deepcopy``.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_item(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_item(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_item(v) for v in value)
+    return value
+
+
+# Item parameters with string values that are repeated across many items in the queue and
+#   the history. The JSON decoder shares the keys between items, but not the values.
+_item_keys_with_repeated_values = ("item_type", "name", "user", "user_group")
+
+
+def _intern_item_values(items):
+    """
+    Replace repeated string values in the list of items with interned strings to reduce memory
+    used by long histories. The items are modified in place.
+    """
+    for item in items:
+        for key in _item_keys_with_repeated_values:
+            value = item.get(key, None)
+            if isinstance(value, str):
+                item[key] = sys.intern(value)
+
 
 class RunEngineClient:
     """
@@ -39,6 +76,16 @@ class RunEngineClient:
         ``user_group_permissions.yaml`` (see documentation for RE Manager).
     """
 
+    # Keys of the UIDs in RE Manager status, the attribute holding the UID of the data
+    #   currently loaded by the client and the method that reloads the data.
+    _status_uids = (
+        ("plan_queue_uid", "_plan_queue_uid", "load_plan_queue"),
+        ("run_list_uid", "_run_list_uid", "load_run_list"),
+        ("plan_history_uid", "_plan_history_uid", "load_plan_history"),
+        ("plans_allowed_uid", "_allowed_plans_uid", "load_allowed_plans"),
+        ("devices_allowed_uid", "_allowed_devices_uid", "load_allowed_devices"),
+    )
+
     def __init__(
         self,
         zmq_control_addr=None,
@@ -75,7 +122,9 @@ class RunEngineClient:
 
         self._re_manager_status = {}
         self._re_manager_connected = None
-        self._re_manager_status_time = time.time()
+        # Time of the last status request. The status was never requested, so the first call
+        #   to 'load_re_manager_status' must not be buffered.
+        self._re_manager_status_time = float("-inf")
         # Minimum period of status update (avoid excessive call frequency)
         self._re_manager_status_update_period = 0.2
 
@@ -92,6 +141,12 @@ class RunEngineClient:
         self._run_list_uid = ""
         self._plan_history_items = []
         self._plan_history_uid = ""
+        # Arguments of queue and history items bound to plan parameters, used to represent
+        #   items in tables. Key: item UID, value: tuple (source, (args, kwargs)), where 'source'
+        #   is a copy of the item name, type, args and kwargs used for binding. Items may be updated
+        #   without changing UID, so 'source' is checked before the cached result is used.
+        #   The cache is cleared whenever the list of allowed plans is reloaded.
+        self._bound_item_arguments = {}
 
         # List of UIDs of the selected queue items, [] if no items are selected
         self._selected_queue_item_uids = []
@@ -104,6 +159,8 @@ class RunEngineClient:
         self.current_dir = None
         # Set the variable to the name of the Queue Server Custom Module (if available)
         self.qserver_custom_module_name = None
+        # Successfully imported custom modules. Key: module name, value: module.
+        self._custom_code_modules = {}
         # List of spreadsheet data types
         self.plan_spreadsheet_data_types = None
         # Dictionary of additional parameters: key - parameter name, value - a dictionary with
@@ -173,34 +230,35 @@ class RunEngineClient:
         # TODO: the new API include efficient implementation of status management, there is no
         #       need to manage status in the application. The following code should be rewritten
         #       to take advantage of the existing API features.
-        if unbuffered or (time.time() - self._re_manager_status_time > self._re_manager_status_update_period):
-            status = self._re_manager_status.copy()
+        if unbuffered or (
+            time.monotonic() - self._re_manager_status_time > self._re_manager_status_update_period
+        ):
             accessible = self._re_manager_connected
+            status_changed = False
             try:
                 new_manager_status = self._client.status()
-                self._re_manager_status.clear()
-                self._re_manager_status.update(new_manager_status)
+                self._re_manager_status_time = time.monotonic()
+                # Compare with the new status directly instead of saving a copy of the old one.
+                #   The dictionary itself is preserved, since it is shared with the application.
+                if new_manager_status != self._re_manager_status:
+                    self._re_manager_status.clear()
+                    self._re_manager_status.update(new_manager_status)
+                    status_changed = True
                 self._re_manager_connected = True
 
-                new_queue_uid = self._re_manager_status.get("plan_queue_uid", "")
-                if new_queue_uid != self._plan_queue_uid:
-                    self.load_plan_queue()
-                new_run_list_uid = self._re_manager_status.get("run_list_uid", "")
-                if new_run_list_uid != self._run_list_uid:
-                    self.load_run_list()
-                new_history_uid = self._re_manager_status.get("plan_history_uid", "")
-                if new_history_uid != self._plan_history_uid:
-                    self.load_plan_history()
-                new_allowed_plans_uid = self._re_manager_status.get("plans_allowed_uid", "")
-                if new_allowed_plans_uid != self._allowed_plans_uid:
-                    self.load_allowed_plans()
-                new_allowed_devices_uid = self._re_manager_status.get("devices_allowed_uid", "")
-                if new_allowed_devices_uid != self._allowed_devices_uid:
-                    self.load_allowed_devices()
+                # Collect all the data that is out of date before reloading any of it, so that
+                #   each kind of data is reloaded at most once per status update.
+                outdated = [
+                    load
+                    for status_key, uid_attr, load in self._status_uids
+                    if self._re_manager_status.get(status_key, "") != getattr(self, uid_attr)
+                ]
+                for load in outdated:
+                    getattr(self, load)()
 
             except (self._client.RequestTimeoutError, self._client.RequestError, self._client.ClientError):
                 self._re_manager_connected = False
-            if (status != self._re_manager_status) or (accessible != self._re_manager_connected):
+            if status_changed or (accessible != self._re_manager_connected):
                 # Status changed. Initiate the updates
                 self.events.status_changed(
                     status=self._re_manager_status,
@@ -217,7 +275,7 @@ class RunEngineClient:
             self._allowed_devices_uid = result["devices_allowed_uid"]
             self.events.allowed_devices_changed(allowed_devices=self._allowed_devices)
         except Exception as ex:
-            print(f"Exception: {ex}")
+            logger.error("Failed to load allowed devices: %s", ex)
 
     def load_allowed_plans(self):
         try:
@@ -227,15 +285,17 @@ class RunEngineClient:
             self._allowed_plans.clear()
             self._allowed_plans.update(result["plans_allowed"])
             self._allowed_plans_uid = result["plans_allowed_uid"]
+            self._bound_item_arguments.clear()
             self.events.allowed_plans_changed(allowed_plans=self._allowed_plans)
         except Exception as ex:
-            print(f"Exception: {ex}")
+            logger.error("Failed to load allowed plans: %s", ex)
 
     def load_plan_queue(self):
         try:
             result = self._client.queue_get()
             if result["success"] is False:
                 raise RuntimeError(f"Failed to load queue: {result['msg']}")
+            _intern_item_values(result["items"])
             self._plan_queue_items.clear()
             self._plan_queue_items.extend(result["items"])
             self._running_item.clear()
@@ -247,6 +307,7 @@ class RunEngineClient:
             self._plan_queue_items_pos = {
                 item["item_uid"]: n for n, item in enumerate(self._plan_queue_items) if "item_uid" in item
             }
+            self._discard_unused_bound_item_arguments()
 
             # Deselect queue items that are not in the queue or are not part of the contiguous
             #   selection. The selection will be cleared when the table is reloaded, so save
@@ -274,7 +335,7 @@ class RunEngineClient:
             )
 
         except Exception as ex:
-            print(f"Exception: {ex}")
+            logger.error("Failed to load plan queue: %s", ex)
 
     def load_run_list(self):
         try:
@@ -291,16 +352,18 @@ class RunEngineClient:
             )
 
         except Exception as ex:
-            print(f"Exception: {ex}")
+            logger.error("Failed to load run list: %s", ex)
 
     def load_plan_history(self):
         try:
             result = self._client.history_get()
             if result["success"] is False:
                 raise RuntimeError(f"Failed to load history: {result['msg']}")
+            _intern_item_values(result["items"])
             self._plan_history_items.clear()
             self._plan_history_items.extend(result["items"])
             self._plan_history_uid = result["plan_history_uid"]
+            self._discard_unused_bound_item_arguments()
 
             # Deselect queue history if it does not exist in the queue
             #   Selection will be cleared when the table is reloaded, so save it in local variable
@@ -315,7 +378,7 @@ class RunEngineClient:
             )
 
         except Exception as ex:
-            print(f"Exception: {ex}")
+            logger.error("Failed to load plan history: %s", ex)
 
     def save_plan_history_to_file(self, *, file_path, file_format):
         """
@@ -436,6 +499,58 @@ class RunEngineClient:
         map_dict = map_dict if (map_dict is not None) else _default_map
         self._map_column_labels_to_keys = map_dict
 
+        # Decide once per label how the value is found in the item and represented as a string,
+        #   instead of doing it for each table cell. Key: label, value: tuple (get_value, to_str).
+        self._map_column_labels_to_getters = {
+            label: self._make_item_value_getter(key_seq) for label, key_seq in map_dict.items()
+        }
+
+    def _make_item_value_getter(self, key_seq):
+        key = key_seq[-1]
+
+        if (len(key_seq) == 1) and (key in ("args", "kwargs")):
+            # Special case: combine args and kwargs to be displayed in one column
+            def get_value(item):
+                return {"args": item.get("args", []), "kwargs": item.get("kwargs", {})}
+
+        elif len(key_seq) == 1:
+            # 'KeyError' exception is raised if the key does not exist
+            get_value = operator.itemgetter(key)
+
+        else:
+
+            def get_value(item):
+                # 'KeyError' exception is raised if a key does not exist
+                value = item
+                for k in key_seq:
+                    value = value[k]
+                return value
+
+        if key in ("args", "kwargs"):
+            to_str = self._item_parameters_to_str
+        elif key == "item_type":
+            to_str = self._item_type_to_str
+        else:
+            to_str = self._item_value_to_str
+
+        return get_value, to_str
+
+    def _item_parameters_to_str(self, item, value):
+        args, kwargs = self._get_bound_item_arguments_cached(item)
+        s_args, s_kwargs = "", ""
+        if args and isinstance(args, collections.abc.Iterable):
+            s_args = ", ".join(map(str, args))
+        if kwargs and isinstance(kwargs, collections.abc.Mapping):
+            s_kwargs = ", ".join([f"{k}: {v}" for k, v in kwargs.items()])
+        return ", ".join([_ for _ in [s_args, s_kwargs] if _])
+
+    def _item_type_to_str(self, item, value):
+        # Print capitalized first letter of the item type ('P' or 'I')
+        return str(value)[:1].upper()
+
+    def _item_value_to_str(self, item, value):
+        return str(value)
+
     def get_bound_item_arguments(self, item):
         item_args = item.get("args", [])
         item_kwargs = item.get("kwargs", {})
@@ -464,6 +579,38 @@ class RunEngineClient:
 
         return item_args, item_kwargs
 
+    def _get_bound_item_arguments_cached(self, item):
+        """
+        Same as ``get_bound_item_arguments``, but the result is cached by item UID. Items may be
+        updated on the server without changing UID, so the cached result is used only if the
+        item name, type and arguments did not change. The returned values must not be modified.
+        """
+        item_uid = item.get("item_uid", None)
+        if item_uid is None:
+            return self.get_bound_item_arguments(item)
+        source = (
+            item.get("name", None),
+            item.get("item_type", None),
+            item.get("args", []),
+            item.get("kwargs", {}),
+        )
+        cached = self._bound_item_arguments.get(item_uid, None)
+        if cached and (cached[0] == source):
+            return cached[1]
+        bound = self.get_bound_item_arguments(item)
+        # Save a copy, so that changes to the item made in place are also detected.
+        self._bound_item_arguments[item_uid] = (_copy_item(source), bound)
+        return bound
+
+    def _discard_unused_bound_item_arguments(self):
+        # Keep the cache from growing indefinitely: forget items that are no longer in the queue
+        #   or the history.
+        unused = self._bound_item_arguments.keys() - self._plan_queue_items_pos.keys()
+        if unused:
+            unused -= {item.get("item_uid", None) for item in self._plan_history_items}
+            for item_uid in unused:
+                del self._bound_item_arguments[item_uid]
+
     def get_item_value_for_label(self, *, item, label, as_str=True):
         """
         Returns parameter value of the item for given label (e.g. table column name). Returns
@@ -492,56 +639,17 @@ class RunEngineClient:
             label or parameter is not found in the dictionary
         """
         try:
-            key_seq = self._map_column_labels_to_keys[label]
+            get_value, to_str = self._map_column_labels_to_getters[label]
         except KeyError:
             raise KeyError(f"Label '{label}' is not found in the map dictionary")
 
-        # Follow the path in the dictionary. 'KeyError' exception is raised if a key does not exist
         try:
-            value = item
-            if (len(key_seq) == 1) and (key_seq[-1] in ("args", "kwargs")):
-                # Special case: combine args and kwargs to be displayed in one column
-                value = {
-                    "args": value.get("args", []),
-                    "kwargs": value.get("kwargs", {}),
-                }
-            else:
-                for key in key_seq:
-                    value = value[key]
+            value = get_value(item)
         except KeyError:
+            key_seq = self._map_column_labels_to_keys[label]
             raise KeyError(f"Parameter with keys {key_seq} is not found in the item dictionary")
 
-        if as_str:
-            key = key_seq[-1]
-
-            s = ""
-            if key in ("args", "kwargs"):
-                value["args"], value["kwargs"] = self.get_bound_item_arguments(item)
-
-                s_args, s_kwargs = "", ""
-                if value["args"] and isinstance(value["args"], collections.abc.Iterable):
-                    s_args = ", ".join(f"{v}" for v in value["args"])
-                if value["kwargs"] and isinstance(value["kwargs"], collections.abc.Mapping):
-                    s_kwargs = ", ".join(f"{k}: {v}" for k, v in value["kwargs"].items())
-                s = ", ".join([_ for _ in [s_args, s_kwargs] if _])
-
-            elif key == "args":
-                if value and isinstance(value, collections.abc.Iterable):
-                    s = ", ".join(f"{v}" for v in value)
-
-            elif key == "item_type":
-                # Print capitalized first letter of the item type ('P' or 'I')
-                s_tmp = str(value)
-                if s_tmp:
-                    s = s_tmp[0].upper()
-
-            else:
-                s = str(value)
-
-        else:
-            s = value
-
-        return s
+        return to_str(item, value) if as_str else value
 
     # ============================================================================
     #                         Queue operations
@@ -584,7 +692,7 @@ class RunEngineClient:
         if item_uid:
             sel_item_pos = self.queue_item_uid_to_pos(item_uid)
             if sel_item_pos >= 0:
-                return copy.deepcopy(self._plan_queue_items[sel_item_pos])
+                return _copy_item(self._plan_queue_items[sel_item_pos])
         return None
 
     def _queue_items_move(self, *, sel_items, ref_item, position):
@@ -632,37 +740,35 @@ class RunEngineClient:
         """
         Move the selected batch of items up by one position
         """
+        sel_item_uids = self._selected_queue_item_uids
         n_items = len(self._plan_queue_items)
-        n_sel_items = len(self.selected_queue_item_uids)
+        n_sel_items = len(sel_item_uids)
         if not n_items or not n_sel_items or (n_items - n_sel_items < 1):
             return
 
-        item_uid = self.selected_queue_item_uids[0]
+        item_uid = sel_item_uids[0]
         n_item = self.queue_item_uid_to_pos(item_uid)
         if item_uid and (n_item > 0):
             n_item_above = n_item - 1
             item_uid_above = self.queue_item_pos_to_uid(n_item_above)
-            self._queue_items_move(
-                sel_items=self._selected_queue_item_uids, ref_item=item_uid_above, position="before"
-            )
+            self._queue_items_move(sel_items=sel_item_uids, ref_item=item_uid_above, position="before")
 
     def queue_items_move_down(self):
         """
         Move the selected batch of items down by one position
         """
+        sel_item_uids = self._selected_queue_item_uids
         n_items = len(self._plan_queue_items)
-        n_sel_items = len(self.selected_queue_item_uids)
+        n_sel_items = len(sel_item_uids)
         if not n_items or not n_sel_items or (n_items - n_sel_items < 1):
             return
 
-        item_uid = self.selected_queue_item_uids[-1]
+        item_uid = sel_item_uids[-1]
         n_item = self.queue_item_uid_to_pos(item_uid)
         if item_uid and (0 <= n_item < n_items - 1):
             n_item_below = n_item + 1
             item_uid_below = self.queue_item_pos_to_uid(n_item_below)
-            self._queue_items_move(
-                sel_items=self._selected_queue_item_uids, ref_item=item_uid_below, position="after"
-            )
+            self._queue_items_move(sel_items=sel_item_uids, ref_item=item_uid_below, position="after")
 
     def queue_items_move_in_place_of(self, uid_ref_item):
         """
@@ -670,22 +776,20 @@ class RunEngineClient:
         the position of the reference item. This is a generic 'move' operation. The reference item
         must not be included in the selected batch.
         """
+        sel_item_uids = self._selected_queue_item_uids
         n_items = len(self._plan_queue_items)
-        n_sel_items = len(self.selected_queue_item_uids)
+        n_sel_items = len(sel_item_uids)
         if not n_items or not n_sel_items or (n_items - n_sel_items < 1):
             return
 
-        sel_item_uid_top = self.selected_queue_item_uids[0]
-        sel_item_uid_bottom = self.selected_queue_item_uids[-1]
-        n_item_top = self.queue_item_uid_to_pos(sel_item_uid_top)
-        n_item_bottom = self.queue_item_uid_to_pos(sel_item_uid_bottom)
-        n_item_to_replace = self.queue_item_uid_to_pos(uid_ref_item)
+        items_pos = self._plan_queue_items_pos
+        n_item_top = items_pos.get(sel_item_uids[0], -1)
+        n_item_bottom = items_pos.get(sel_item_uids[-1], -1)
+        n_item_to_replace = items_pos.get(uid_ref_item, -1)
 
         if (n_item_to_replace < n_item_top) or (n_item_to_replace > n_item_bottom):
             position = "before" if (n_item_to_replace < n_item_top) else "after"
-            self._queue_items_move(
-                sel_items=self._selected_queue_item_uids, ref_item=uid_ref_item, position=position
-            )
+            self._queue_items_move(sel_items=sel_item_uids, ref_item=uid_ref_item, position=position)
 
     def queue_items_move_to_top(self):
         """
@@ -816,9 +920,11 @@ class RunEngineClient:
             # The 'item' and 'item_uid' should always be included in the returned item in case of success.
             sel_item_uid = response["item"]["item_uid"]
         except KeyError as ex:
-            print(
-                f"Item or item UID is not found in the server response {pprint.pformat(response)}. "
-                f"Can not update item selection in the queue table. Exception: {ex}"
+            logger.error(
+                "Item or item UID is not found in the server response %r. "
+                "Can not update item selection in the queue table. Exception: %s",
+                response,
+                ex,
             )
         self.selected_queue_item_uids = [sel_item_uid]
 
@@ -848,9 +954,11 @@ class RunEngineClient:
             # The 'item' and 'item_uid' should always be included in the returned item in case of success.
             sel_item_uid = response["item"]["item_uid"]
         except KeyError as ex:
-            print(
-                f"Item or item UID is not found in the server response {pprint.pformat(response)}. "
-                f"Can not update item selection in the queue table. Exception: {ex}"
+            logger.error(
+                "Item or item UID is not found in the server response %r. "
+                "Can not update item selection in the queue table. Exception: %s",
+                response,
+                ex,
             )
         self.selected_queue_item_uids = [sel_item_uid]
 
@@ -868,14 +976,9 @@ class RunEngineClient:
         if not items:
             return
 
-        sel_item_uids = self.selected_queue_item_uids.copy()
-
-        if sel_item_uids:
-            # Insert after the last item in the selected batch
-            sel_item_uid = sel_item_uids[-1]
-        else:
-            # No selection: push to the back of the queue
-            sel_item_uid = None
+        # Insert after the last item in the selected batch. No selection: push to the back of the queue
+        sel_item_uids = self._selected_queue_item_uids
+        sel_item_uid = sel_item_uids[-1] if sel_item_uids else None
 
         queue_is_empty = not len(self._plan_queue_items)
         if not params:
@@ -905,13 +1008,36 @@ class RunEngineClient:
             # The 'item' and 'item_uid' should always be included in the returned item in case of success.
             sel_item_uids = [_["item_uid"] for _ in response["items"]]
         except KeyError as ex:
-            print(
-                f"Item or item UID is not found in some of the items returned by the server "
-                f"{pprint.pformat(response)}. Can not update item selection in the queue table. "
-                f"Exception: {ex}"
+            logger.error(
+                "Item or item UID is not found in some of the items returned by the server %r. "
+                "Can not update item selection in the queue table. Exception: %s",
+                response,
+                ex,
             )
         self.selected_queue_item_uids = sel_item_uids
 
+    def _get_custom_code_module(self):
+        """
+        Returns Queue Server Custom Module with the name ``qserver_custom_module_name`` or ``None``
+        if the name is not set or the module can not be imported. The module is imported once,
+        failed imports are attempted again next time.
+        """
+        custom_code_module_name = self.qserver_custom_module_name
+        if not custom_code_module_name:
+            return None
+
+        custom_code_module = self._custom_code_modules.get(custom_code_module_name, None)
+        if custom_code_module is None:
+            try:
+                logger.info("Importing custom module '%s' ...", custom_code_module_name)
+                custom_code_module = importlib.import_module(custom_code_module_name.replace("-", "_"))
+                logger.info("Module '%s' was imported successfully.", custom_code_module_name)
+                self._custom_code_modules[custom_code_module_name] = custom_code_module
+            except Exception as ex:
+                logger.error("Failed to import custom instrument module '%s': %s", custom_code_module_name, ex)
+
+        return custom_code_module
+
     def queue_upload_spreadsheet(self, *, file_path, data_type=None, **kwargs):
         # ``kwargs``` are passed to the custom spreadsheet processing function
         # TODO: significant part of this function is duplication of the code from
@@ -922,22 +1048,9 @@ class RunEngineClient:
         file_path = os.path.abspath(file_path)
         _, f_name = os.path.split(file_path)
 
-        with open(file_path, "rb") as f:
-            custom_code_module_name = self.qserver_custom_module_name
-
-            custom_code_module = None
-            if custom_code_module_name:
-                try:
-                    print(f"Importing custom module '{custom_code_module_name}' ...")
-                    # logger.info("Importing custom module '%s' ...", custom_code_module_name)
-                    custom_code_module = importlib.import_module(custom_code_module_name.replace("-", "_"))
-                    print(f"Module '{custom_code_module_name}' was imported successfully.")
-                    # logger.info("Module '%s' was imported successfully.", custom_code_module_name)
-                except Exception as ex:
-                    print(f"Failed to import custom instrument module '{custom_code_module_name}': {ex}")
-                    # logger.error("Failed to import custom instrument module '%s':
-                    # %s", custom_code_module_name, ex)
+        custom_code_module = self._get_custom_code_module()
 
+        with open(file_path, "rb") as f:
             item_list = []
             processed = False
             if custom_code_module and ("spreadsheet_to_plan_list" in custom_code_module.__dict__):
@@ -976,8 +1089,7 @@ class RunEngineClient:
             #   instructions, but it is responsibility of the user to set item types correctly.
             #   By default an item is considered a plan.
             for item in item_list:
-                if "item_type" not in item:
-                    item["item_type"] = "plan"
+                item.setdefault("item_type", "plan")
 
             # logger.debug("The following plans were created: %s", pprint.pformat(item_list))
 
@@ -1024,7 +1136,7 @@ class RunEngineClient:
         selected_item_pos = self.selected_history_item_pos
         if selected_item_pos:
             # Copy data before sending it for processing by another model
-            history_item = copy.deepcopy(self._plan_history_items[selected_item_pos[0]])
+            history_item = _copy_item(self._plan_history_items[selected_item_pos[0]])
             self.events.history_item_process(item=history_item)
 
     def history_clear(self):
@@ -1081,15 +1193,11 @@ class RunEngineClient:
 
         # Wait for the environment to be created.
         if timeout:
-            t_stop = time.time() + timeout
-            while True:
-                self.load_re_manager_status()
-                status2 = self._re_manager_status
-                if status2["worker_environment_exists"] and status2["manager_state"] == "idle":
-                    break
-                if timeout and (time.time() > t_stop):
-                    raise RuntimeError("Failed to start RE Worker: timeout occurred")
-                time.sleep(0.5)
+
+            def condition(status):
+                return status["worker_environment_exists"] and status["manager_state"] == "idle"
+
+            self._wait_for_completion(condition=condition, msg="open RE Worker environment", timeout=timeout)
 
         self.activate_env_destroy(False)
 
@@ -1122,17 +1230,11 @@ class RunEngineClient:
         except Exception as ex:
             raise RuntimeError(f"Failed to close RE Worker environment: {ex}") from ex
 
-        # Wait for the environment to be created.
-        if timeout:
-            t_stop = time.time() + timeout
-        while True:
-            self.load_re_manager_status()
-            status2 = self._re_manager_status
-            if not status2["worker_environment_exists"] and status2["manager_state"] == "idle":
-                break
-            if timeout and (time.time() > t_stop):
-                raise RuntimeError("Failed to start RE Worker: timeout occurred")
-            time.sleep(0.5)
+        # Wait for the environment to be closed.
+        def condition(status):
+            return not status["worker_environment_exists"] and status["manager_state"] == "idle"
+
+        self._wait_for_completion(condition=condition, msg="close RE Worker environment", timeout=timeout)
 
         self.activate_env_destroy(False)
 
@@ -1189,17 +1291,11 @@ class RunEngineClient:
         except Exception as ex:
             raise RuntimeError(f"Failed to destroy RE Worker environment: {ex}") from ex
 
-        # Wait for the environment to be created.
-        if timeout:
-            t_stop = time.time() + timeout
-        while True:
-            self.load_re_manager_status()
-            status2 = self._re_manager_status
-            if not status2["worker_environment_exists"] and status2["manager_state"] == "idle":
-                break
-            if timeout and (time.time() > t_stop):
-                raise RuntimeError("Failed to start RE Worker: timeout occurred")
-            time.sleep(0.5)
+        # Wait for the environment to be destroyed.
+        def condition(status):
+            return not status["worker_environment_exists"] and status["manager_state"] == "idle"
+
+        self._wait_for_completion(condition=condition, msg="destroy RE Worker environment", timeout=timeout)
 
         self.activate_env_destroy(False)
 
@@ -1240,17 +1336,27 @@ class RunEngineClient:
     #                        RE Control
 
     def _wait_for_completion(self, *, condition, msg="complete operation", timeout=0):
+        """
+        Poll RE Manager status until ``condition(status)`` is satisfied. Raises ``RuntimeError``
+        if ``timeout`` expires. If ``timeout=0``, waits until the condition is satisfied.
+        The polling period starts at 10 ms and is doubled after each check up to 0.5 s.
+        While it is shorter than the minimum status update period, the status is requested
+        unbuffered, so that fast operations are detected quickly instead of re-reading
+        the status loaded before the operation was started.
+        """
         if timeout:
-            t_stop = time.time() + timeout
+            t_stop = time.monotonic() + timeout
 
+        delay = 0.01
         while True:
-            self.load_re_manager_status()
+            self.load_re_manager_status(unbuffered=delay < self._re_manager_status_update_period)
             status = self._re_manager_status
             if condition(status):
                 break
-            if timeout and (time.time() > t_stop):
+            if timeout and (time.monotonic() > t_stop):
                 raise RuntimeError(f"Failed to {msg}: timeout occurred")
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
 
     def re_pause(self, timeout=0, *, option):
         """